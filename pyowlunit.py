@@ -1,4 +1,5 @@
 from pyowlunit import TestSuite
+from pyowlunit.utils import parsing
 import logging
 import colorlog
 import argparse
@@ -8,9 +9,21 @@ parser = argparse.ArgumentParser(description="Execute test according to Owl Unit
 parser.add_argument("-s", "--suite", metavar="suite", type=str, required=True,
                     help="IRI to the suite that will be executed or local file.")
 parser.add_argument("-f", "--format", nargs="?", const="xml", metavar="format",
-                    help="Format in which the tests have been serialized.")
+                    help="Format used for the documents whose serialization can't be detected.")
+parser.add_argument("-m", "--matrix", nargs="+", action="append", metavar=("ontology", "version"),
+                    help="Run the suite against local versions of the tested ontology identified by its IRI. "
+                         "Can be repeated for different ontologies.")
+parser.add_argument("-p", "--parse-stats", action="store_true",
+                    help="Log parsing throughput of every loaded document.")
 args = parser.parse_args()
 
+# merge versions of the same ontology
+versions = dict()
+for iri, *ontology_versions in args.matrix or []:
+  if len(ontology_versions) == 0:
+    parser.error(f"argument -m/--matrix: no version given for {iri}")
+  versions.setdefault(iri, []).extend(ontology_versions)
+
 # Color results
 logger = colorlog.getLogger()
 handler = colorlog.StreamHandler()
@@ -22,7 +35,16 @@ logger.setLevel(logging.INFO)
 logger = colorlog.getLogger("pyowlunit")
 
 try:
-  ts = TestSuite(args.suite, format=args.format)
-  ts.test()
+  with parsing.record_parse_stats() as parse_stats:
+    ts = TestSuite(args.suite, format=args.format)
+    if versions:
+      ts.test_matrix(versions)
+    else:
+      ts.test()
 except AssertionError as e:
-  logger.critical(f"{e}")
\ No newline at end of file
+  logger.critical(f"{e}")
+
+if args.parse_stats:
+  for stats in parse_stats:
+    logger.info(f"{stats.location} ({stats.format}, {stats.parser}): {stats.triples} triples "
+                f"in {stats.seconds:.3f}s, {stats.triples_per_second:.0f} triples/s")
\ No newline at end of file
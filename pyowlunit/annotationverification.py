@@ -1,8 +1,10 @@
 import rdflib
+from pyowlunit.utils import parsing
 from rdflib.namespace import RDF
 import json
-from typing import Union
+from typing import Optional, Union
 import logging
+import threading
 from pyowlunit.errors import AVViolation
 import dictdiffer
 
@@ -17,6 +19,30 @@ from java.lang import String
 
 logger = logger = logging.getLogger('AV')
 
+# TODO: Support additional shape graph
+SHAPE_ONTOLOGY_URI = "https://raw.githubusercontent.com/luigi-asprino/owl-unit/main/shapes/ontology.ttl"
+
+# shapes models are shared among all annotation verification tests
+_shapes_models = dict()
+_shapes_lock = threading.Lock()
+
+def load_shapes_model(uri: str = SHAPE_ONTOLOGY_URI):
+  """
+  Load a shapes graph in jena, each graph is read only once
+
+  Args:
+      uri (str, optional): URI of the shapes graph. Defaults to SHAPE_ONTOLOGY_URI.
+
+  Returns:
+      Model: Jena model containing the shapes
+  """
+  with _shapes_lock:
+    if uri not in _shapes_models:
+      shapesModel = ModelFactory.createDefaultModel()
+      RDFDataMgr.read(shapesModel, uri)
+      _shapes_models[uri] = shapesModel
+    return _shapes_models[uri]
+
 AV_DATA_QUERY = """
   PREFIX owlunit: <https://w3id.org/OWLunit/ontology/>
   PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
@@ -41,7 +67,7 @@ class AnnotationVerification(object):
   """
   Represent an Owl Unit annotation verification test as a python object
   """
-  def __init__(self, testuri: str, format: str = "xml"):
+  def __init__(self, testuri: str, format: Optional[str] = None):
     """
     Initialize annotation verification test by loading the test
     graph and its information. Data loading is postponed to the instant in which
@@ -50,15 +76,16 @@ class AnnotationVerification(object):
     Args:
         testuri (str): URI of the test, a path to a local file
         # TODO: Support online resources
-        format (str, optional): Format in which the graph have been serialized. Defaults to "xml".
+        format (str, optional): Format used for the graphs whose serialization can't be detected
+                                from their extension, content type or content. Defaults to None.
                                 See https://rdflib.readthedocs.io/en/stable/apidocs/rdflib.html#rdflib.graph.Graph.parse
                                 for supported formats.
     Raises:
         ValueError: TBD: Custom exception for error handling
     """
-    av_graph = rdflib.Graph()
+    self.uri = testuri
     self.format = format
-    av_graph.parse(testuri, format=self.format)
+    av_graph = parsing.parse(testuri, format=format)
     logger.debug("EP Graph parsed")
 
     av_data = av_graph.query(AV_DATA_QUERY)
@@ -69,10 +96,13 @@ class AnnotationVerification(object):
 
     self.tested_ontology = str(av_data.testedOntology)
   
-  def test(self) -> bool:
+  def test(self, tested_ontology: Optional[str] = None) -> bool:
     """Execute test by loading the data and executing the SPARQL query.
     Response is deserialized and equality with expected response is checked.
 
+    Args:
+        tested_ontology (str, optional): IRI of a version of the tested ontology to be
+                                         verified in place of the one declared by the test.
     Raises:
         ValueError: TBD: Custom exceptions for error failing
 
@@ -81,15 +111,12 @@ class AnnotationVerification(object):
     """
     # Load tested ontology in jena
     ontologyModel = ModelFactory.createDefaultModel()
-    RDFDataMgr.read(ontologyModel, self.tested_ontology)
+    RDFDataMgr.read(ontologyModel, tested_ontology or self.tested_ontology)
     # etxract testedOntology base prefix, to avoid logging tests for imported ontologies 
     # (which might not satisfy the shapes ontology)
     testedOntologyBasePrefix = str(ontologyModel.getNsPrefixMap().get(""))
     # load shapes model in jena
-    # TODO: Support additional shape graph
-    shape_ontology_uri = "https://raw.githubusercontent.com/luigi-asprino/owl-unit/main/shapes/ontology.ttl"
-    shapesModel = ModelFactory.createDefaultModel()
-    RDFDataMgr.read(shapesModel, shape_ontology_uri)
+    shapesModel = load_shapes_model()
     # validate the model using SHACL library
     validationResult = ValidationUtil.validateModel(ontologyModel, shapesModel, False)
     reportModel = validationResult.getModel()
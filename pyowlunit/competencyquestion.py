@@ -1,6 +1,7 @@
 import rdflib
+from pyowlunit.utils import parsing
 import json
-from typing import Union
+from typing import Optional, Union
 import logging
 from pyowlunit import errors
 import dictdiffer
@@ -11,12 +12,13 @@ CQ_DATA_QUERY = """
   PREFIX owlunit: <https://w3id.org/OWLunit/ontology/>
   PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
 
-  SELECT ?inputData ?sparqlQuery ?expectedResult ?competencyQuestion
+  SELECT ?inputData ?sparqlQuery ?expectedResult ?competencyQuestion ?testedOntology
   WHERE {
       ?x owlunit:hasInputData ?inputData ;
         owlunit:hasSPARQLUnitTest ?sparqlQuery ;
         owlunit:hasExpectedResult ?expectedResult ;
         owlunit:hasCompetencyQuestion ?competencyQuestion .
+      OPTIONAL { ?x owlunit:testsOntology ?testedOntology }
   }
   """
 
@@ -24,7 +26,7 @@ class CompetencyQuestionVerification(object):
   """
   Represent an Owl Unit competency question test as a python object
   """
-  def __init__(self, testuri: str, format: str = "xml"):
+  def __init__(self, testuri: str, format: Optional[str] = None):
     """
     Initialize competency question verification by loading the competency question
     graph and its information. Data loading is postponed to the instant in which
@@ -33,16 +35,17 @@ class CompetencyQuestionVerification(object):
     Args:
         testuri (str): URI of the test, a path to a local file
         # TODO: Support online resources
-        format (str, optional): Format in which the graph have been serialized. Defaults to "xml".
+        format (str, optional): Format used for the graphs whose serialization can't be detected
+                                from their extension, content type or content. Defaults to None.
                                 See https://rdflib.readthedocs.io/en/stable/apidocs/rdflib.html#rdflib.graph.Graph.parse
                                 for supported formats.
     Raises:
         ValueError: TBD: Custom exception for error handling
     """
     # build the inner graph containing the test competency question
-    self.cq_graph = rdflib.Graph()
+    self.uri = testuri
     self.format = format
-    self.cq_graph.parse(testuri, format=self.format)
+    self.cq_graph = parsing.parse(testuri, format=self.format)
     logger.debug("CQ Graph parsed")
 
     cq_data = self.cq_graph.query(CQ_DATA_QUERY)
@@ -64,19 +67,22 @@ class CompetencyQuestionVerification(object):
 
     # postpone input data loading to test execution to increase efficiency
     self.input_uri = str(cq_data.inputData)
+    self.tested_ontology = str(cq_data.testedOntology) if cq_data.testedOntology is not None else None
   
-  def test(self) -> bool:
+  def test(self, tested_ontology: Optional[str] = None) -> bool:
     """Execute test by loading the data and executing the SPARQL query.
     Response is deserialized and equality with expected response is checked.
 
+    Args:
+        tested_ontology (str, optional): Accepted for uniformity with the other tests, the
+                                         competency question is only evaluated on its input data.
     Raises:
         ValueError: TBD: Custom exceptions for error failing
 
     Returns:
         bool: True if the test didn't fail.
     """
-    cq_data = rdflib.Graph()
-    cq_data.parse(self.input_uri, format=self.format)
+    cq_data = parsing.parse(self.input_uri, format=self.format)
 
     # execute query
     result = cq_data.query(self.sparql_test_query)
@@ -1,6 +1,7 @@
 import rdflib
+from pyowlunit.utils import parsing
 from rdflib.namespace import RDF
-from typing import Union
+from typing import Optional, Union
 import logging
 from pyowlunit import errors
 
@@ -10,6 +11,7 @@ jb.load_owlapi()
 from org.semanticweb.owlapi.apibinding import OWLManager
 from org.semanticweb.owlapi.reasoner import SimpleConfiguration
 from org.semanticweb.owlapi.model import IRI
+from org.semanticweb.owlapi.util import SimpleIRIMapper
 from org.semanticweb.HermiT import ReasonerFactory
 
 logger = logger = logging.getLogger('EP')
@@ -29,7 +31,7 @@ class ErrorProvocation(object):
   """
   Represent an Owl Unit error provocation test as a python object
   """
-  def __init__(self, testuri: str, format: str = "xml"):
+  def __init__(self, testuri: str, format: Optional[str] = None):
     """
     Initialize error provocation test by loading the test
     graph and its information. Data loading is postponed to the instant in which
@@ -38,15 +40,16 @@ class ErrorProvocation(object):
     Args:
         testuri (str): URI of the test, a path to a local file
         # TODO: Support online resources
-        format (str, optional): Format in which the graph have been serialized. Defaults to "xml".
+        format (str, optional): Format used for the graphs whose serialization can't be detected
+                                from their extension, content type or content. Defaults to None.
                                 See https://rdflib.readthedocs.io/en/stable/apidocs/rdflib.html#rdflib.graph.Graph.parse
                                 for supported formats.
     Raises:
         ValueError: TBD: Custom exception for error handling
     """
-    ep_graph = rdflib.Graph()
+    self.uri = testuri
     self.format = format
-    ep_graph.parse(testuri, format=self.format)
+    ep_graph = parsing.parse(testuri, format=format)
     logger.debug("EP Graph parsed")
 
     ep_data = ep_graph.query(EP_DATA_QUERY)
@@ -59,12 +62,17 @@ class ErrorProvocation(object):
     self.input_uri = str(ep_data.inputData)
     self.tested_ontology = str(ep_data.testedOntology)
   
-  def test(self) -> bool:
+  def test(self, tested_ontology: Optional[str] = None) -> bool:
     """Execute test by loading the data and executing the SPARQL query.
     Response is deserialized and equality with expected response is checked.
 
+    Args:
+        tested_ontology (str, optional): IRI of a version of the tested ontology to be
+                                         used in place of the one declared by the test.
+                                         Imports of the tested ontology are redirected to it.
     Raises:
         ValueError: TBD: Custom exceptions for error failing
+        OntologyVersionError: If the input data does not import the tested ontology version
 
     Returns:
         bool: True if the test didn't fail.
@@ -73,7 +81,18 @@ class ErrorProvocation(object):
     inputDataIRI = IRI.create(self.input_uri)
     # load ontology in owlapi lib
     ontologyManager = OWLManager.createOWLOntologyManager()
+    if tested_ontology is not None:
+      # resolve the tested ontology to the requested version
+      versionIRI = IRI.create(tested_ontology)
+      mapper = SimpleIRIMapper(IRI.create(self.tested_ontology), versionIRI)
+      ontologyManager.getIRIMappers().add(mapper)
     owlOntology = ontologyManager.loadOntology(inputDataIRI)
+    if tested_ontology is not None:
+      # the version is only loaded when input data imports exactly the tested ontology IRI
+      documentIRIs = [ontologyManager.getOntologyDocumentIRI(o) for o in owlOntology.getImportsClosure()]
+      if not any(documentIRI.equals(versionIRI) for documentIRI in documentIRIs):
+        raise errors.OntologyVersionError(f"{self.input_uri} does not import {self.tested_ontology}, "
+                                          f"version {tested_ontology} has not been loaded")
     # build reasoner
     reasoner = ReasonerFactory().createReasoner(owlOntology, SimpleConfiguration())
     consistent = reasoner.isConsistent()
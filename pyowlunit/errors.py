@@ -17,6 +17,13 @@ class ErrorProvocationFailure(OwlUnitException):
   """
   pass
 
+class OntologyVersionError(OwlUnitException):
+  """
+  Exception to be used when a version of the tested ontology can't be
+  tested because the test input data does not import it.
+  """
+  pass
+
 class InferenceVerificationError(OwlUnitException):
   """
   Exception to be used when an InferenceVerification tests fails.
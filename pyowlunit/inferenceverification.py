@@ -1,10 +1,12 @@
 import rdflib
+from pyowlunit.utils import parsing
 from rdflib.namespace import RDF
 import json
-from typing import Union
+from typing import Optional, Union
 import logging
 import dictdiffer
 import re
+import threading
 from pyowlunit.errors import InferenceVerificationError
 
 import pyowlunit.utils.javabridge as jb
@@ -35,7 +37,7 @@ class InferenceVerification(object):
   """
   Represent an Owl Unit inference verification test as a python object
   """
-  def __init__(self, testuri: str, format: str = "xml"):
+  def __init__(self, testuri: str, format: Optional[str] = None):
     """
     Initialize inference verification test by loading the test
     graph and its information. Data loading is postponed to the instant in which
@@ -44,15 +46,16 @@ class InferenceVerification(object):
     Args:
         testuri (str): URI of the test, a path to a local file
         # TODO: Support online resources
-        format (str, optional): Format in which the graph have been serialized. Defaults to "xml".
+        format (str, optional): Format used for the graphs whose serialization can't be detected
+                                from their extension, content type or content. Defaults to None.
                                 See https://rdflib.readthedocs.io/en/stable/apidocs/rdflib.html#rdflib.graph.Graph.parse
                                 for supported formats.
     Raises:
         ValueError: TBD: Custom exception for error handling
     """
-    iv_graph = rdflib.Graph()
+    self.uri = testuri
     self.format = format
-    iv_graph.parse(testuri, format=self.format)
+    iv_graph = parsing.parse(testuri, format=format)
     logger.debug("IV Graph parsed")
 
     av_data = iv_graph.query(IV_DATA_QUERY)
@@ -65,11 +68,32 @@ class InferenceVerification(object):
     self.input_data = str(av_data.inputData)
     self.sparql_query = str(av_data.sparqlQuery)
     self.expected_result = bool(av_data.expectedResult)
+
+    # input data is loaded once and shared among executions
+    self._data_model = None
+    self._data_lock = threading.Lock()
+
+  def load_input_data(self):
+    """
+    Load input data in jena, data is read only once.
+
+    Returns:
+        Model: Jena model containing the input data
+    """
+    with self._data_lock:
+      if self._data_model is None:
+        dataModel = ModelFactory.createDefaultModel()
+        RDFDataMgr.read(dataModel, self.input_data)
+        self._data_model = dataModel
+      return self._data_model
   
-  def test(self) -> bool:
+  def test(self, tested_ontology: Optional[str] = None) -> bool:
     """Execute test by loading the data and executing the SPARQL query.
     Response is deserialized and equality with expected response is checked.
 
+    Args:
+        tested_ontology (str, optional): IRI of a version of the tested ontology to be
+                                         used in place of the one declared by the test.
     Raises:
         ValueError: TBD: Custom exceptions for error failing
 
@@ -78,10 +102,9 @@ class InferenceVerification(object):
     """
     # load tested ontology in jena
     ontologyModel = ModelFactory.createDefaultModel()
-    RDFDataMgr.read(ontologyModel, self.tested_ontology)
+    RDFDataMgr.read(ontologyModel, tested_ontology or self.tested_ontology)
     # load data in jena
-    dataModel = ModelFactory.createDefaultModel()
-    RDFDataMgr.read(dataModel, self.input_data)
+    dataModel = self.load_input_data()
     # merge ontologies
     ontology = ontologyModel.union(dataModel)
 
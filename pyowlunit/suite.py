@@ -1,10 +1,14 @@
 import rdflib
+from pyowlunit.utils import parsing
 from pyowlunit.competencyquestion import CompetencyQuestionVerification
 from pyowlunit.errorprovocation import ErrorProvocation
 from pyowlunit.annotationverification import AnnotationVerification
 from pyowlunit.inferenceverification import InferenceVerification
+from pyowlunit.utils import as_iri
 import logging
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 
 TESTS_QUERY = """
 PREFIX owlunit: <https://w3id.org/OWLunit/ontology/>
@@ -28,8 +32,10 @@ class TestSuite(object):
     "https://w3id.org/OWLunit/ontology/AnnotationVerification": AnnotationVerification,
     "https://w3id.org/OWLunit/ontology/InferenceVerification": InferenceVerification
   }
+  # matrix column of the tests run against the ontology they declare
+  DECLARED_VERSION = "declared"
 
-  def __init__(self, testuri: str, format: str = "xml"):
+  def __init__(self, testuri: str, format: Optional[str] = None):
     """
     Initialize the test suite by loading the suite graph and 
     intializing all the testing tasks
@@ -39,13 +45,13 @@ class TestSuite(object):
     Args:
         testuri (str): URI of the test, a path to a local file
         # TODO: Support online resources
-        format (str, optional): Format in which the graph have been serialized. Defaults to "xml".
+        format (str, optional): Format used for the graphs whose serialization can't be detected
+                                from their extension, content type or content. Defaults to None.
                                 See https://rdflib.readthedocs.io/en/stable/apidocs/rdflib.html#rdflib.graph.Graph.parse
                                 for supported formats.
     """
     # build the inner graph containing the test suite
-    self.suite_graph = rdflib.Graph()
-    self.suite_graph.parse(testuri, format=format)
+    self.suite_graph = parsing.parse(testuri, format=format)
 
     self.tests = defaultdict(set)
     self.passed_tests = set()
@@ -137,4 +143,77 @@ class TestSuite(object):
     self.test_inference_verification()
 
     log.warning(f"{len(self.passed_tests)}/{sum(len(tests) for tests in self.tests.values())} test passed.")
+
+  def test_matrix(self, versions: Dict[str, List[str]], max_workers: Optional[int] = None) -> Dict[str, Dict[str, bool]]:
+    """
+    Run all tests against several versions of the tested ontologies.
+    The suite and the test graphs are loaded once, the AV shapes graph and the IV
+    input data are shared among the executions and each (test, version) pair is run
+    in parallel. EP tests load and reason over their input data for every version,
+    since it imports the tested ontology.
+    Competency questions are only evaluated on their input data, hence they are
+    executed once and their outcome is reported for every version.
+
+    Args:
+        versions (Dict[str, List[str]]): Mapping from a `testsOntology` IRI to the
+                                         local paths (or IRIs) of its versions.
+        max_workers (int, optional): Number of parallel executions. Defaults to
+                                     ThreadPoolExecutor default.
+
+    Returns:
+        Dict[str, Dict[str, bool]]: Pass/fail matrix in the form {test uri: {version: passed}}.
+                                    Tests whose ontology is not in `versions` are run once
+                                    against the declared ontology and reported under DECLARED_VERSION.
+    Raises:
+        ValueError: If no version is given for a tested ontology
+    """
+    log = logging.getLogger("MATRIX")
+
+    empty = [iri for iri, ontology_versions in versions.items() if len(ontology_versions) == 0]
+    if len(empty) > 0:
+      raise ValueError(f"No version given for {', '.join(empty)}")
+
+    # (test, version IRI, versions the outcome is reported for)
+    jobs = list()
+    for test_type, tests in self.tests.items():
+      for test in tests:
+        tested_ontology = test.tested_ontology
+        if tested_ontology not in versions:
+          jobs.append((test, None, [self.DECLARED_VERSION]))
+        elif test_type == "https://w3id.org/OWLunit/ontology/CompetencyQuestionVerification":
+          jobs.append((test, None, list(versions[tested_ontology])))
+        else:
+          for version in versions[tested_ontology]:
+            jobs.append((test, as_iri(version), [version]))
+
+    def run(test, version: Optional[str]) -> bool:
+      try:
+        test.test(tested_ontology=version)
+        return True
+      except Exception as e:
+        # TODO: Better error handling
+        log.error(f"{test.uri} @ {version or test.tested_ontology} - ERROR {str(e).strip()}")
+        return False
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+      futures = [executor.submit(run, test, version) for test, version, _ in jobs]
+      results = [future.result() for future in futures]
+
+    matrix = defaultdict(dict)
+    for (test, _, labels), passed in zip(jobs, results):
+      for label in labels:
+        matrix[test.uri][label] = passed
+
+    for test_uri, row in matrix.items():
+      outcome = " | ".join([f"{version}: {'PASSED' if passed else 'ERROR'}" for version, passed in row.items()])
+      if all(row.values()):
+        log.info(f"{test_uri} - {outcome}")
+      else:
+        log.error(f"{test_uri} - {outcome}")
+
+    passed = sum(passed for row in matrix.values() for passed in row.values())
+    total = sum(len(row) for row in matrix.values())
+    log.warning(f"{passed}/{total} test runs passed.")
+
+    return dict(matrix)
     
@@ -0,0 +1,16 @@
+import os
+import pathlib
+
+def as_iri(location: str) -> str:
+  """
+  Turn a local path into a file IRI, IRIs are returned untouched.
+
+  Args:
+      location (str): Local path or IRI of a resource
+
+  Returns:
+      str: IRI of the resource
+  """
+  if os.path.exists(location):
+    return pathlib.Path(location).resolve().as_uri()
+  return location
@@ -0,0 +1,297 @@
+import rdflib
+from rdflib.parser import Parser, create_input_source
+from rdflib.plugin import PluginException
+from rdflib.namespace import XSD
+from rdflib.plugins.stores.memory import Memory
+import rdflib.util
+from contextlib import contextmanager
+from pyowlunit.utils import as_iri
+import logging
+import mmap
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+from typing import Iterator, List, NamedTuple, Optional
+from urllib.parse import urldefrag, urlparse
+from urllib.request import url2pathname
+
+logger = logging.getLogger('PARSE')
+
+# number of bytes read to sniff the format of a document
+SNIFF_SIZE = 4096
+
+CONTENT_TYPE_FORMAT = {
+  "application/rdf+xml": "xml",
+  "application/xml": "xml",
+  "text/xml": "xml",
+  "text/turtle": "turtle",
+  "application/x-turtle": "turtle",
+  "application/n-triples": "nt",
+  "application/n-quads": "nquads",
+  "application/trig": "trig",
+  "text/n3": "n3",
+  "application/ld+json": "json-ld",
+  "application/json": "json-ld",
+}
+
+# native-accelerated parsers (e.g. oxrdflib) registered as rdflib plugins,
+# used in place of the pure python ones whenever they are installed
+FAST_FORMAT = {
+  "xml": "ox-xml",
+  "turtle": "ox-turtle",
+  "nt": "ox-ntriples",
+  "nquads": "ox-nquads",
+  "trig": "ox-trig",
+  "n3": "ox-n3",
+  "nt11": "ox-nt11",
+  "json-ld": "ox-json-ld",
+}
+
+# explicit xsd:string datatypes, which the fast parsers can't tell from plain literals
+TYPED_STRING = re.compile(rb"XMLSchema#string|[:;]string\b")
+
+# extensions shared by several formats, the content is sniffed first
+AMBIGUOUS_EXTENSIONS = (".owl",)
+
+_IRI = r"<[^>]*>"
+_BNODE = r"_:\S+"
+_LITERAL = r'"(?:[^"\\]|\\.)*"(?:@[A-Za-z0-9-]+|\^\^<[^>]*>)?'
+NTRIPLES_LINE = re.compile(rf"^({_IRI}|{_BNODE})\s+{_IRI}\s+({_IRI}|{_BNODE}|{_LITERAL})\s*\.$")
+NQUADS_LINE = re.compile(rf"^({_IRI}|{_BNODE})\s+{_IRI}\s+({_IRI}|{_BNODE}|{_LITERAL})\s+({_IRI}|{_BNODE})\s*\.$")
+
+class ParseStats(NamedTuple):
+  """
+  Parsing statistics of a single document
+  """
+  location: str
+  format: str
+  parser: str
+  triples: int
+  seconds: float
+
+  @property
+  def triples_per_second(self) -> float:
+    return self.triples / self.seconds if self.seconds > 0 else float("inf")
+
+# statistics collectors opened by record_parse_stats
+_recorders: List[List[ParseStats]] = list()
+_recorders_lock = threading.Lock()
+
+@contextmanager
+def record_parse_stats() -> Iterator[List[ParseStats]]:
+  """
+  Collect the statistics of the documents parsed within the context.
+
+  Yields:
+      List[ParseStats]: List filled with the statistics of every parsed document
+  """
+  stats = list()
+  with _recorders_lock:
+    _recorders.append(stats)
+  try:
+    yield stats
+  finally:
+    with _recorders_lock:
+      _recorders.remove(stats)
+
+def _local_path(location: str) -> Optional[str]:
+  """
+  Get the local path of a location, if it is a local file.
+
+  Args:
+      location (str): Local path or IRI of a resource
+
+  Returns:
+      Optional[str]: Path of the file, None if the resource is not local
+  """
+  if os.path.isfile(location):
+    return location
+  url = urlparse(location)
+  if url.scheme == "file" and os.path.isfile(url2pathname(url.path)):
+    return url2pathname(url.path)
+  return None
+
+def sniff_format(head: bytes) -> Optional[str]:
+  """
+  Guess the format of a document from its first bytes.
+
+  Args:
+      head (bytes): First bytes of the document, at most SNIFF_SIZE
+
+  Returns:
+      Optional[str]: rdflib format name, None if it can't be guessed
+  """
+  text = head.decode("utf-8", errors="ignore").lstrip("\ufeff \t\r\n")
+  if re.match(r"<(\?xml|!doctype|!--|rdf:RDF\b)", text, re.IGNORECASE):
+    return "xml"
+  if text.startswith("{") or re.match(r"\[\s*\{", text):
+    return "json-ld"
+  lines = text.splitlines()
+  # the last line is truncated when the document is longer than the sniffed bytes
+  if len(head) >= SNIFF_SIZE:
+    lines = lines[:-1]
+  # skip comments
+  lines = [line.strip() for line in lines]
+  lines = [line for line in lines if len(line) > 0 and not line.startswith("#")]
+  if len(lines) == 0:
+    return None
+  if re.match(r"(@prefix|@base|prefix|base)\b", lines[0], re.IGNORECASE):
+    return "turtle"
+  if all(NTRIPLES_LINE.match(line) for line in lines):
+    # the rest of the document might use turtle syntax, which is a superset of n-triples
+    return "turtle"
+  if all(NTRIPLES_LINE.match(line) or NQUADS_LINE.match(line) for line in lines):
+    return "nquads"
+  if lines[0][0] in "<[(" or lines[0].startswith("_:"):
+    return "turtle"
+  return None
+
+def guess_format(location: str, content_type: Optional[str] = None, head: Optional[bytes] = None) -> Optional[str]:
+  """
+  Guess the format of a document from its extension, its content type
+  or by sniffing its first bytes, in this order. Ambiguous extensions
+  are only used when the content can't be sniffed.
+
+  Args:
+      location (str): Local path or IRI of the document
+      content_type (str, optional): Content type the document has been served with. Defaults to None.
+      head (bytes, optional): First bytes of the document. Defaults to None.
+
+  Returns:
+      Optional[str]: rdflib format name, None if it can't be guessed
+  """
+  path = urldefrag(location)[0]
+  format = rdflib.util.guess_format(path)
+  if format is not None and path.lower().endswith(AMBIGUOUS_EXTENSIONS) and head is not None:
+    format = sniff_format(head) or format
+  if format is None and content_type is not None:
+    format = CONTENT_TYPE_FORMAT.get(content_type.split(";")[0].strip().lower())
+  if format is None and head is not None:
+    format = sniff_format(head)
+  return format
+
+def _has_plugin(name: str, kind: type) -> bool:
+  """
+  Check whether an rdflib plugin is installed.
+  """
+  try:
+    rdflib.plugin.get(name, kind)
+    return True
+  except PluginException:
+    return False
+
+def fast_format(format: str) -> str:
+  """
+  Get the name of the fastest installed parser for a format.
+
+  Args:
+      format (str): rdflib format name
+
+  Returns:
+      str: Name of the accelerated parser if installed, `format` otherwise
+  """
+  if format in FAST_FORMAT and _has_plugin(FAST_FORMAT[format], Parser):
+    return FAST_FORMAT[format]
+  return format
+
+def _has_typed_strings(path: str) -> bool:
+  """
+  Check whether a document might contain `xsd:string` typed literals.
+  """
+  with open(path, "rb") as f:
+    if os.fstat(f.fileno()).st_size == 0:
+      return False
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+      return TYPED_STRING.search(content) is not None
+
+class _PlainStringMemory(Memory):
+  """
+  Memory store turning `xsd:string` literals into plain literals, as
+  produced by rdflib parsers, so that query results don't depend on the parser.
+  Documents with explicit `xsd:string` literals are not parsed by the fast parsers.
+  """
+  def addN(self, quads):
+    super().addN((s, p, _plain(o), c) for s, p, o, c in quads)
+
+def _plain(term):
+  """
+  Turn an `xsd:string` literal into a plain literal.
+  """
+  if isinstance(term, rdflib.Literal) and term.datatype == XSD.string:
+    return rdflib.Literal(str(term))
+  return term
+
+def _parse(location: str, path: str, parser: Optional[str]) -> rdflib.Graph:
+  """
+  Parse a local copy of a document with the given parser.
+  """
+  graph = rdflib.Graph()
+  if parser in FAST_FORMAT.values():
+    graph = rdflib.Graph(store=_PlainStringMemory())
+  graph.parse(path, publicID=as_iri(location), format=parser)
+  return graph
+
+def _parse_local(location: str, path: str, format: Optional[str], content_type: Optional[str] = None) -> rdflib.Graph:
+  """
+  Parse a local copy of a document, detecting its format and recording
+  parsing statistics. When parsing fails the sniffed format and the given
+  one are tried in turn, each with the fast parser first.
+  """
+  with open(path, "rb") as f:
+    head = f.read(SNIFF_SIZE)
+  formats = [guess_format(location, content_type=content_type, head=head), sniff_format(head), format]
+  formats = [f for i, f in enumerate(formats) if f is not None and f not in formats[:i]] or [None]
+  fast = not _has_typed_strings(path)
+  attempts = [(f, p) for f in formats for p in dict.fromkeys([fast_format(f) if fast and f is not None else f, f])]
+
+  for i, (format, parser) in enumerate(attempts):
+    start = time.perf_counter()
+    try:
+      graph = _parse(location, path, parser)
+      break
+    except Exception as e:
+      if i == len(attempts) - 1:
+        raise
+      logger.debug(f"{parser} failed on {location}, trying {attempts[i + 1][1]}: {e}")
+  seconds = time.perf_counter() - start
+
+  stats = ParseStats(location, str(format), str(parser), len(graph), seconds)
+  with _recorders_lock:
+    for recorder in _recorders:
+      recorder.append(stats)
+  logger.debug(f"{location} parsed as {format} with {parser}: {stats.triples} triples, "
+               f"{stats.triples_per_second:.0f} triples/s")
+  return graph
+
+def parse(location: str, format: Optional[str] = None) -> rdflib.Graph:
+  """
+  Parse a document into a new graph, detecting its format and using the
+  fastest parser available for it. Online documents are downloaded to a
+  temporary file first, so that recorded statistics only account for parsing.
+
+  Args:
+      location (str): Local path or IRI of the document
+      format (str, optional): Format used when the document's format can't be detected or
+                              the detected one fails, rdflib default is used if None. See https://rdflib.readthedocs.io/en/stable/apidocs/rdflib.html#rdflib.graph.Graph.parse
+                              for supported formats. Defaults to None.
+
+  Returns:
+      rdflib.Graph: Graph containing the document
+  """
+  path = _local_path(location)
+  if path is not None:
+    return _parse_local(location, path, format)
+
+  source = create_input_source(location=location, format=format)
+  content_type = getattr(source, "content_type", None)
+  with tempfile.TemporaryDirectory() as tmp:
+    path = os.path.join(tmp, "document")
+    with open(path, "wb") as f:
+      try:
+        shutil.copyfileobj(source.getByteStream(), f)
+      finally:
+        source.close()
+    return _parse_local(location, path, format, content_type)
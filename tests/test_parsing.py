@@ -0,0 +1,98 @@
+import glob
+import os
+import json
+import pytest
+import rdflib
+from rdflib.compare import isomorphic
+from pyowlunit.utils import parsing
+
+EXAMPLES_PATH = os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "examples", "local")
+
+@pytest.mark.parametrize("head, format", [
+  (b"<http://a> <http://b> <http://c> .\n", "turtle"),
+  (b'<http://a> <http://b> "x y"@en .\n_:b <http://b> "1"^^<http://int> .', "turtle"),
+  (b"<http://a> <http://b> <http://c> <http://g> .\n", "nquads"),
+  (b"@prefix ex: <http://e/> .", "turtle"),
+  (b"# comment\nPREFIX ex: <http://e/>\nex:a ex:b ex:c .", "turtle"),
+  (b"<http://a> <http://b> <http://c> ;\n  <http://d> <http://e> .", "turtle"),
+  (b"[ a <http://x> ] .", "turtle"),
+  (b'<?xml version="1.0"?>\n<rdf:RDF/>', "xml"),
+  (b'<!DOCTYPE rdf:RDF [ <!ENTITY x "y"> ]>\n<rdf:RDF/>', "xml"),
+  (b"<!-- comment -->\n<rdf:RDF/>", "xml"),
+  (b'<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"/>', "xml"),
+  (b'{"@id": "http://a"}', "json-ld"),
+  (b'[ {"@id": "http://a"} ]', "json-ld"),
+  (b"", None),
+  (b"# only a comment", None),
+])
+def test_sniff_format(head, format):
+  assert parsing.sniff_format(head) == format
+
+def test_sniff_format_truncated():
+  # the last line of a truncated document is ignored
+  head = (b"<http://a> <http://b> <http://c> .\n" * 200)[:parsing.SNIFF_SIZE]
+  assert not head.endswith(b".\n")
+  assert parsing.sniff_format(head) == "turtle"
+
+@pytest.mark.parametrize("path", glob.glob(os.path.join(EXAMPLES_PATH, "*")))
+def test_sniff_examples(path):
+  with open(path, "rb") as f:
+    head = f.read(parsing.SNIFF_SIZE)
+  assert parsing.sniff_format(head) == parsing.guess_format(path)
+
+def test_guess_format_order():
+  # extension first, then content type, then content
+  assert parsing.guess_format("http://a/doc.ttl", content_type="application/rdf+xml") == "turtle"
+  assert parsing.guess_format("http://a/doc", content_type="application/rdf+xml", head=b"@prefix a: <b> .") == "xml"
+  assert parsing.guess_format("http://a/doc", content_type="text/plain", head=b"@prefix a: <b> .") == "turtle"
+  assert parsing.guess_format("http://a/doc") is None
+
+def test_guess_format_ambiguous_extension():
+  assert parsing.guess_format("http://a/doc.owl", head=b"@prefix a: <b> .") == "turtle"
+  assert parsing.guess_format("http://a/doc.owl", head=b"<rdf:RDF/>") == "xml"
+  assert parsing.guess_format("http://a/doc.owl") == "xml"
+
+def test_parse_turtle_owl(tmp_path):
+  # turtle serialized in a .owl file
+  path = tmp_path / "turtle.owl"
+  path.write_bytes(open(os.path.join(EXAMPLES_PATH, "datacq.ttl"), "rb").read())
+  assert len(parsing.parse(str(path))) == 1
+  assert len(parsing.parse(str(path), format="turtle")) == 1
+
+def test_fast_format():
+  assert parsing.fast_format("turtle") in ("turtle", parsing.FAST_FORMAT["turtle"])
+  assert parsing.fast_format("trix") == "trix"
+
+def test_parse_records_stats():
+  path = os.path.join(EXAMPLES_PATH, "pizza.owl")
+  with parsing.record_parse_stats() as stats:
+    graph = parsing.parse(path, format="turtle")
+  parsing.parse(path)
+
+  assert len(stats) == 1
+  assert stats[0].format == "xml"
+  assert stats[0].triples == len(graph) > 0
+
+@pytest.mark.parametrize("path", glob.glob(os.path.join(EXAMPLES_PATH, "*")))
+def test_fast_parse_matches_rdflib(path):
+  pytest.importorskip("oxrdflib")
+  format = parsing.guess_format(path)
+  expected = rdflib.Graph().parse(path, format=format)
+  graph = parsing.parse(path)
+
+  assert isomorphic(graph, expected)
+  query = "SELECT ?p ?o WHERE { ?s ?p ?o FILTER(isLiteral(?o)) } ORDER BY ?p ?o"
+  assert json.loads(graph.query(query).serialize(format="json")) == \
+         json.loads(expected.query(query).serialize(format="json"))
+
+@pytest.mark.parametrize("content", [
+  b'<http://a> <http://b> "Luigi" .',
+  b'<http://a> <http://b> "Luigi"^^<http://www.w3.org/2001/XMLSchema#string> .',
+])
+def test_fast_parse_string_literals(tmp_path, content):
+  path = tmp_path / "data.ttl"
+  path.write_bytes(content)
+  expected = rdflib.Graph().parse(str(path), format="turtle")
+  graph = parsing.parse(str(path))
+
+  assert set(graph) == set(expected)
@@ -0,0 +1,73 @@
+import os
+import pytest
+from collections import defaultdict
+from pyowlunit import suite
+from pyowlunit.utils import as_iri
+
+CQ = "https://w3id.org/OWLunit/ontology/CompetencyQuestionVerification"
+EP = "https://w3id.org/OWLunit/ontology/ErrorProvocation"
+IV = "https://w3id.org/OWLunit/ontology/InferenceVerification"
+
+ONTOLOGY = "http://example.org/ontology#"
+EXAMPLES_PATH = os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "examples", "local")
+V1 = os.path.join(EXAMPLES_PATH, "pizza.owl")
+V2 = "http://example.org/ontology/2.0"
+
+class StubTest(object):
+  """
+  Test recording the ontology versions it has been run against
+  """
+  def __init__(self, uri, tested_ontology, failing=()):
+    self.uri = uri
+    self.tested_ontology = tested_ontology
+    self.failing = set(failing)
+    self.calls = list()
+
+  def test(self, tested_ontology=None):
+    self.calls.append(tested_ontology)
+    if tested_ontology in self.failing:
+      raise Exception("failed")
+    return True
+
+def build_suite(*tests):
+  test_suite = suite.TestSuite.__new__(suite.TestSuite)
+  test_suite.tests = defaultdict(set)
+  test_suite.passed_tests = set()
+  for test_type, test in tests:
+    test_suite.tests[test_type].add(test)
+  return test_suite
+
+def test_matrix_one_job_per_version():
+  ep = StubTest("ep", ONTOLOGY, failing=[V2])
+  iv = StubTest("iv", ONTOLOGY)
+  matrix = build_suite((EP, ep), (IV, iv)).test_matrix({ONTOLOGY: [V1, V2]})
+
+  assert sorted(ep.calls) == sorted([as_iri(V1), V2])
+  assert sorted(iv.calls) == sorted([as_iri(V1), V2])
+  assert as_iri(V1) != V1
+  assert matrix == {"ep": {V1: True, V2: False}, "iv": {V1: True, V2: True}}
+
+def test_matrix_cq_run_once():
+  cq = StubTest("cq", ONTOLOGY)
+  matrix = build_suite((CQ, cq)).test_matrix({ONTOLOGY: [V1, V2]})
+
+  assert cq.calls == [None]
+  assert matrix == {"cq": {V1: True, V2: True}}
+
+def test_matrix_declared_ontology():
+  ep = StubTest("ep", "http://example.org/other#")
+  cq = StubTest("cq", None)
+  matrix = build_suite((EP, ep), (CQ, cq)).test_matrix({ONTOLOGY: [V1]})
+
+  assert ep.calls == [None]
+  assert cq.calls == [None]
+  assert matrix == {
+    "ep": {suite.TestSuite.DECLARED_VERSION: True},
+    "cq": {suite.TestSuite.DECLARED_VERSION: True}
+  }
+
+def test_matrix_empty_versions():
+  ep = StubTest("ep", ONTOLOGY)
+  with pytest.raises(ValueError):
+    build_suite((EP, ep)).test_matrix({ONTOLOGY: []})
+  assert ep.calls == []